@@ -30,17 +30,6 @@ export function scorelineShort(
 	return `${toInitials(homeTeam)} ${homeGoals} - ${awayGoals} ${toInitials(awayTeam)}`;
 }
 
-export function toTitleCase(str: string): string {
-	return str
-		.toLowerCase()
-		.split(' ')
-		.map(function (word) {
-			return word.charAt(0).toUpperCase() + word.slice(1);
-		})
-		.join(' ')
-		.replace('And', 'and');
-}
-
 export function slugAlias(slug: string): string {
 	switch (slug) {
 		case 'brighton':
@@ -1,20 +1,23 @@
 import type { Score } from "./types";
 
+export function roundScore(score: Score): Score {
+	return {
+		homeGoals: Math.round(score.homeGoals),
+		awayGoals: Math.round(score.awayGoals)
+	};
+}
+
+// Expects predicted goals already rounded with roundScore
 export function identicalScore(prediction: Score, actual: Score): boolean {
-	return (
-		Math.round(prediction.homeGoals) === actual.homeGoals &&
-		Math.round(prediction.awayGoals) === actual.awayGoals
-	);
+	return prediction.homeGoals === actual.homeGoals && prediction.awayGoals === actual.awayGoals;
 }
 
+// Expects predicted goals already rounded with roundScore
 export function sameResult(prediction: Score, actual: Score): boolean {
+	// Results match when the goal differences share the same sign (-1, 0 or 1)
 	return (
-		(Math.round(prediction.homeGoals) > Math.round(prediction.awayGoals) &&
-			Math.round(actual.homeGoals) > Math.round(actual.awayGoals)) ||
-		(Math.round(prediction.homeGoals) === Math.round(prediction.awayGoals) &&
-			Math.round(actual.homeGoals) === Math.round(actual.awayGoals)) ||
-		(Math.round(prediction.homeGoals) < Math.round(prediction.awayGoals) &&
-			Math.round(actual.homeGoals) < Math.round(actual.awayGoals))
+		Math.sign(prediction.homeGoals - prediction.awayGoals) ===
+		Math.sign(actual.homeGoals - actual.awayGoals)
 	);
 }
 
@@ -0,0 +1,63 @@
+import { CURRENT_SEASON } from '$lib/consts';
+import { teams } from '$lib/server/database/teams';
+
+type CacheEntry = {
+	key: number | string;
+	value: Promise<unknown>;
+};
+
+const cache = new Map<string, CacheEntry>();
+
+/**
+ * Fetch only the lastUpdated timestamp of the current season's team data. The
+ * updater writes the team data last in each run, after the fantasy data and
+ * predictions, so a timestamp that has changed means every collection the
+ * pages read has been updated and this acts as a version for all of them.
+ */
+export async function lastUpdated() {
+	const data = await teams.findOne(
+		{ _id: CURRENT_SEASON },
+		{ projection: { _id: 0, lastUpdated: 1 } }
+	);
+	if (!data || data.lastUpdated == null) {
+		return null;
+	}
+	// The updater stores a BSON date, read back as a Date object; compare its
+	// time value as two Date objects are never equal by reference
+	const updated = data.lastUpdated;
+	return updated instanceof Date ? updated.getTime() : String(updated);
+}
+
+/**
+ * Return the value previously computed for this name if the database has not
+ * been updated since, otherwise compute and store it. The pending promise is
+ * stored straight away so concurrent requests after an update share a single
+ * computation rather than each querying the database.
+ */
+export async function cached<T>(name: string, compute: () => Promise<T>): Promise<T> {
+	const key = await lastUpdated();
+	const entry = cache.get(name);
+	if (key !== null && entry !== undefined && entry.key === key) {
+		return entry.value as Promise<T>;
+	}
+
+	const value = compute();
+	if (key === null) {
+		return value;
+	}
+
+	const newEntry = { key, value };
+	cache.set(name, newEntry);
+	// Don't hold on to failed or empty results
+	const forget = () => {
+		if (cache.get(name) === newEntry) {
+			cache.delete(name);
+		}
+	};
+	value.then((result) => {
+		if (!result) {
+			forget();
+		}
+	}, forget);
+	return value;
+}
@@ -0,0 +1,36 @@
+import { cached } from '$lib/server/cache';
+import { fantasy } from '$lib/server/database/fantasy';
+import { filterDataByPage } from '../../routes/fantasy/data';
+import type { FantasyData, Page } from '../../routes/fantasy/fantasy.types';
+
+const pages: Page[] = ['all', 'forward', 'midfielder', 'defender', 'goalkeeper'];
+
+export type FantasySnapshot = {
+	data: FantasyData;
+	pageData: { [page in Page]: FantasyData };
+};
+
+async function loadFantasy() {
+	const doc = (await fantasy.find({ _id: 'fantasy' }).toArray())[0];
+	if (doc === undefined) {
+		return null;
+	}
+	const data = Object(doc) as FantasyData;
+
+	// Filter players for every page once per update rather than per request
+	const pageData = {} as FantasySnapshot['pageData'];
+	for (const page of pages) {
+		pageData[page] = filterDataByPage(data, page);
+	}
+	return { data, pageData } as FantasySnapshot;
+}
+
+/**
+ * Fetch the fantasy data with each page's filtered players, only re-read from
+ * the database after the updater has run. The updater replaces the fantasy
+ * document before writing the team data's lastUpdated timestamp, so a snapshot
+ * cached under a new timestamp is always read from the new document.
+ */
+export async function fetchFantasy() {
+	return cached('fantasy', loadFantasy);
+}
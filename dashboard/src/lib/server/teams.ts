@@ -0,0 +1,42 @@
+import { CURRENT_SEASON } from '$lib/consts';
+import { cached } from '$lib/server/cache';
+import { teams } from '$lib/server/database/teams';
+import { getCurrentMatchday, getTeams, playedMatchdayDates } from '$lib/team';
+import type { Team } from '$lib/types';
+import type { TeamsData } from '../../routes/[team=team]/dashboard.types';
+
+export type TeamParams = {
+	currentMatchday: string;
+	playedDates: Date[];
+};
+
+export type TeamsSnapshot = {
+	data: TeamsData;
+	teamParams: { [team in Team]?: TeamParams };
+};
+
+async function loadTeams() {
+	const doc = (await teams.find({ _id: CURRENT_SEASON }).toArray())[0];
+	if (doc === undefined) {
+		return null;
+	}
+	const data = Object(doc) as TeamsData;
+
+	// Derive each team's page parameters once per update rather than per request
+	const teamParams: TeamsSnapshot['teamParams'] = {};
+	for (const team of getTeams(data)) {
+		teamParams[team] = {
+			currentMatchday: getCurrentMatchday(data, team),
+			playedDates: playedMatchdayDates(data, team)
+		};
+	}
+	return { data, teamParams } as TeamsSnapshot;
+}
+
+/**
+ * Fetch the current season's team data, shared between the dashboard pages
+ * and only re-read from the database after the updater has run.
+ */
+export async function fetchTeams() {
+	return cached('teams', loadTeams);
+}
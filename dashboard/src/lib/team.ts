@@ -1,5 +1,5 @@
-import type { Form, TeamsData } from '../routes/[team]/dashboard.types';
-import type { Team } from './types';
+import type { Form, TeamsData } from '../routes/[team=team]/dashboard.types';
+import { Team } from './types';
 
 export function toInitials(team: Team): string {
 	switch (team) {
@@ -45,6 +45,13 @@ export function getTeamID(team: Team): string {
 	return team.toLowerCase().replace(/ /g, '-');
 }
 
+// Team ID (hyphenated slug) -> team name, built once for the fixed set of teams
+const teamIDs = new Map<string, Team>(Object.values(Team).map((team) => [getTeamID(team), team]));
+
+export function toTeam(teamID: string): Team | undefined {
+	return teamIDs.get(teamID);
+}
+
 export function teamInSeason(form: Form, team: Team, season: number): boolean {
 	return team in form && form[team][season]['1'] != null;
 }
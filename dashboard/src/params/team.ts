@@ -0,0 +1,9 @@
+import type { ParamMatcher } from '@sveltejs/kit';
+import { slugAlias } from '$lib/format';
+import { toTeam } from '$lib/team';
+
+// Only route team slugs (or their aliases) to the team dashboard so any
+// other path 404s without querying the database
+export const match: ParamMatcher = (param) => {
+	return toTeam(slugAlias(param)) !== undefined;
+};
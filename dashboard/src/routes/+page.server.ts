@@ -1,14 +1,8 @@
 import type { PageServerLoad } from './$types';
-import type { TeamsData } from './[team]/dashboard.types';
-import { getTitle, validTeam } from './[team]/data';
-import { getCurrentMatchday, playedMatchdayDates, getTeamID, getTeams } from '$lib/team';
-import { CURRENT_SEASON } from '$lib/consts';
-import { teams } from '$lib/server/database/teams';
-
-async function fetchTeams() {
-	const data = Object((await teams.find({_id: CURRENT_SEASON}).toArray())[0]);
-	return data as TeamsData
-}
+import type { TeamsData } from './[team=team]/dashboard.types';
+import { getTitle, validTeam } from './[team=team]/data';
+import { getTeamID, getTeams } from '$lib/team';
+import { fetchTeams } from '$lib/server/teams';
 
 function getTeam(data: TeamsData) {
 	const team = Object.keys(data.standings)[0];
@@ -16,14 +10,15 @@ function getTeam(data: TeamsData) {
 }
 
 export const load: PageServerLoad = async () => {
-	const data = await fetchTeams();
-	if (!data) {
+	const snapshot = await fetchTeams();
+	if (!snapshot) {
 		return {
 			status: 500,
 			error: new Error('Failed to load data')
 		};
 	}
 
+	const { data, teamParams } = snapshot;
 	const team = getTeam(data);
 	const teams = getTeams(data);
 	if (!validTeam(team, teams)) {
@@ -34,8 +29,7 @@ export const load: PageServerLoad = async () => {
 	}
 
 	const title = getTitle(team);
-	const currentMatchday = getCurrentMatchday(data, team);
-	const playedDates = playedMatchdayDates(data, team);
+	const { currentMatchday, playedDates } = teamParams[team]!;
 	const teamID = getTeamID(team);
 	return {
 		slug: null,
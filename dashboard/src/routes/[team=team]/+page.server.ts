@@ -0,0 +1,41 @@
+import type { PageServerLoad } from './$types';
+import { getTitle, validTeam } from './data';
+import { slugAlias } from '$lib/format';
+import { getTeams, toTeam } from '$lib/team';
+import { fetchTeams } from '$lib/server/teams';
+
+export const load: PageServerLoad = async ({ params }: { params: { team: string } }) => {
+	const slug = slugAlias(params.team);
+	const snapshot = await fetchTeams();
+	if (!snapshot) {
+		return {
+			status: 500,
+			error: new Error('Failed to load data')
+		};
+	}
+
+	const { data, teamParams } = snapshot;
+	const team = toTeam(slug);
+	const teams = getTeams(data);
+	if (team === undefined || !validTeam(team, teams)) {
+		return {
+			status: 404,
+			error: new Error('Team not found')
+		};
+	}
+
+	const title = getTitle(team);
+	const { currentMatchday, playedDates } = teamParams[team]!;
+	return {
+		slug,
+		team: {
+			name: team,
+			id: slug
+		},
+		teams,
+		title,
+		currentMatchday,
+		playedDates,
+		data
+	};
+}
@@ -1,14 +1,9 @@
-import { fantasy } from '$lib/server/database/fantasy';
+import { fetchFantasy } from '$lib/server/fantasy';
 import type { PageServerLoad } from './$types';
 
-async function fetchFantasy() {
-	const data = Object((await fantasy.find({ _id: "fantasy" }).toArray())[0])
-	return data
-}
-
 export const load: PageServerLoad = async () => {
-	const data = await fetchFantasy();
-	if (!data) {
+	const snapshot = await fetchFantasy();
+	if (!snapshot) {
 		return {
 			status: 500,
 			error: new Error('Failed to load data')
@@ -16,9 +11,9 @@ export const load: PageServerLoad = async () => {
 	}
 
 	return {
-		data,
+		data: snapshot.data,
 		page: 'all',
 		title: 'Fantasy',
-		pageData: data
+		pageData: snapshot.pageData.all
 	};
 }
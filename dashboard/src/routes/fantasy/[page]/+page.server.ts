@@ -1,13 +1,7 @@
-import { fantasy } from '$lib/server/database/fantasy';
-import { filterDataByPage } from '../data';
+import { fetchFantasy } from '$lib/server/fantasy';
 import type { PageServerLoad } from './$types';
 import { getTitle } from '../data';
 
-async function fetchFantasy() {
-	const data = Object((await fantasy.find({ _id: "fantasy" }).toArray())[0])
-	return data
-}
-
 export const load: PageServerLoad = async ({ params }: { params: { page: string } }) => {
 	const page = params.page;
 
@@ -25,22 +19,20 @@ export const load: PageServerLoad = async ({ params }: { params: { page: string
 		};
 	}
 
-	const data = await fetchFantasy();
-	if (!data) {
+	const snapshot = await fetchFantasy();
+	if (!snapshot) {
 		return {
 			status: 500,
 			error: new Error('Failed to load data')
 		};
 	}
 
-	const pageData = filterDataByPage(data, page);
-
 	const title = getTitle(page);
 
 	return {
-		data,
+		data: snapshot.data,
 		page,
 		title,
-		pageData
+		pageData: snapshot.pageData[page]
 	};
 }
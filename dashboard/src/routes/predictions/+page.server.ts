@@ -1,10 +1,14 @@
 import { predictions as predictionsCollection } from '$lib/server/database/predictions';
+import { cached } from '$lib/server/cache';
 import type { PageServerLoad } from './$types';
-import { calcAccuracy, sortByDate } from './data';
+import { calcAccuracy } from './data';
 import type { PredictionsData } from './predictions.types';
 
 async function fetchPredictions() {
+	// Let the database order matchdays newest first and games within each
+	// matchday by kick-off time, rather than sorting in JS on each fetch
 	const predictions = Object(await predictionsCollection.aggregate([
+		{ "$sort": { "datetime": 1 } },
 		{
 			"$group": {
 				"_id": {
@@ -15,10 +19,10 @@ async function fetchPredictions() {
 				},
 				"predictions": { "$push": "$$ROOT" },
 			}
-		}
+		},
+		{ "$sort": { "_id": -1 } }
 	]).toArray());
 
-	sortByDate(predictions);
 	const accuracy = calcAccuracy(predictions);
 	const data = {
 		accuracy,
@@ -28,7 +32,8 @@ async function fetchPredictions() {
 }
 
 export const load: PageServerLoad = async () => {
-	const data = await fetchPredictions();
+	// Sorting and colouring only needs redoing when the updater has run
+	const data = await cached('predictions', fetchPredictions);
 	if (!data) {
 		return {
 			status: 500,
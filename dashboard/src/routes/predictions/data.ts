@@ -1,5 +1,5 @@
-import { identicalScore, sameResult } from '$lib/goals';
-import type { Accuracy, MatchdayPredictions, Prediction } from './predictions.types';
+import { identicalScore, roundScore, sameResult } from '$lib/goals';
+import type { Accuracy, MatchdayPredictions } from './predictions.types';
 
 /**
  * Insert green, yellow or red color values representing the results of completed
@@ -16,11 +16,13 @@ export function calcAccuracy(predictions: MatchdayPredictions[]) {
 				continue;
 			}
 
-			if (identicalScore(prediction.prediction, prediction.actual)) {
+			// Round the predicted goals once for both comparisons
+			const predicted = roundScore(prediction.prediction);
+			if (identicalScore(predicted, prediction.actual)) {
 				prediction.color = 'green';
 				scoreCorrect += 1;
 				resultCorrect += 1;
-			} else if (sameResult(prediction.prediction, prediction.actual)) {
+			} else if (sameResult(predicted, prediction.actual)) {
 				prediction.color = 'yellow';
 				resultCorrect += 1;
 			} else {
@@ -32,19 +34,7 @@ export function calcAccuracy(predictions: MatchdayPredictions[]) {
 
 	const accuracy: Accuracy = {
 		scoreAccuracy: total > 0 ? scoreCorrect / total : 0,
-		resultAccuracy: total > 0 ? resultCorrect / 0 : 0	
+		resultAccuracy: total > 0 ? resultCorrect / total : 0
 	};
 	return accuracy
 }
-
-export function sortByDate(predictions: MatchdayPredictions[]) {
-	predictions.sort((a, b) => {
-		return (new Date(b._id)).getTime() - (new Date(a._id)).getTime();
-	});
-	// Sort each day of predictions by time
-	for (let i = 0; i < predictions.length; i++) {
-		predictions[i].predictions.sort((a: Prediction, b: Prediction) => {
-			return (new Date(a.datetime)).getTime() - (new Date(b.datetime)).getTime();
-		});
-	}
-}
@@ -10,7 +10,8 @@ class OptimisePredictions:
     def correct_result(
         ph: int | float, pa: int | float, ah: int | float, aa: int | float
     ):
-        return (ph > pa and ah > aa) or (ph == pa and ah == aa) or (ph < pa and ah < aa)
+        # Results match when the goal differences share the same sign
+        return ((ph > pa) - (ph < pa)) == ((ah > aa) - (ah < aa))
 
     @staticmethod
     def game_result_tuple(match: dict):
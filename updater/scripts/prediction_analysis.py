@@ -1,6 +1,8 @@
+import asyncio
+
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import numpy as np
-from src.format import extract_int_score_from_scoreline, identical_result
 from src.database import Database
 
 
@@ -9,85 +11,113 @@ class PredictionsAnalysis:
         self.current_season = current_season
         self.prediction_file = f"data/predictions_{current_season}.json"
         self.database = Database()
+        self._data = None
 
     def get_data(self):
-        data = self.database.get_predictions()
-        return data
-
-    def by_form(self, actual_scoreline, home_form_rating, away_form_rating):
-        act_home_goals, act_away_goals = extract_int_score_from_scoreline(
-            actual_scoreline
-        )
-        # Compare whether comparison in goals scored by each team matches comparison in their form rating
-        return identical_result(
-            act_home_goals, act_away_goals, home_form_rating, away_form_rating
-        )
-
-    def if_predicted_by_form(self, predictions):
-        total = 0
-        count = 0
+        # Fetch once and share between possible_predictions and
+        # analyse_predictions rather than querying the database for each
+        if self._data is None:
+            self._data = asyncio.run(self.database.get_predictions())
+        return self._data
+
+    @staticmethod
+    def _parse_scorelines(scorelines: list[str]):
+        # Split every "HOM X - Y AWA" scoreline in one pass and take the goals
+        if len(scorelines) == 0:
+            return np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int8)
+        tokens = np.array(np.char.split(scorelines).tolist())
+        return tokens[:, 1].astype(np.int8), tokens[:, 3].astype(np.int8)
+
+    def _flatten_predictions(self, predictions):
+        """Walk the predictions once, collecting the actual goals alongside the
+        form ratings and previous match goals each prediction started from."""
+        scorelines = []
+        home_form_ratings = []
+        away_form_ratings = []
+        prev_home_goals = []
+        prev_away_goals = []
+        by_prev_matches = []
         for prediction in predictions.values():
             for pred in prediction:
                 if pred["actual"] is None or pred["details"] is None:
                     continue
-                if self.by_form(
-                    pred["actual"],
-                    pred["details"]["adjustments"][0]["homeFormRating"],
-                    pred["details"]["adjustments"][0]["awayFormRating"],
-                ):
-                    count += 1
-                total += 1
-        return count / total
-
-    def by_prev_matches(self, actual_scoreline, home_goals, away_goals):
-        act_home_goals, act_away_goals = extract_int_score_from_scoreline(
-            actual_scoreline
+                scorelines.append(pred["actual"])
+                adjustments = pred["details"]["adjustments"][0]
+                home_form_ratings.append(adjustments["homeFormRating"])
+                away_form_ratings.append(adjustments["awayFormRating"])
+                starting = pred["details"]["starting"]
+                prev_home_goals.append(starting["homeGoals"])
+                prev_away_goals.append(starting["awayGoals"])
+                by_prev_matches.append(
+                    starting["description"] == "Previous match average"
+                )
+
+        act_home_goals, act_away_goals = self._parse_scorelines(scorelines)
+        return {
+            "actHomeGoals": act_home_goals,
+            "actAwayGoals": act_away_goals,
+            "homeFormRating": np.array(home_form_ratings, dtype=float),
+            "awayFormRating": np.array(away_form_ratings, dtype=float),
+            "prevHomeGoals": np.array(prev_home_goals, dtype=float),
+            "prevAwayGoals": np.array(prev_away_goals, dtype=float),
+            "byPrevMatches": np.array(by_prev_matches, dtype=bool),
+        }
+
+    @staticmethod
+    def identical_results(act_home_goals, act_away_goals, home_goals, away_goals):
+        return np.sign(act_home_goals - act_away_goals) == np.sign(
+            home_goals - away_goals
+        )
+
+    @staticmethod
+    def _accuracy(correct: np.ndarray):
+        # np.mean of an empty selection is nan with a warning, not an accuracy
+        if correct.size == 0:
+            raise ValueError("Cannot calculate accuracy: no matching predictions.")
+        return float(np.mean(correct))
+
+    def if_predicted_by_form(self, predictions):
+        flat = self._flatten_predictions(predictions)
+        # Compare whether comparison in goals scored by each team matches comparison in their form rating
+        return self._accuracy(
+            self.identical_results(
+                flat["actHomeGoals"],
+                flat["actAwayGoals"],
+                flat["homeFormRating"],
+                flat["awayFormRating"],
+            )
         )
-        # Compare whether comparison in goals scored by each team matches comparison in the average of their previous matches
-        return identical_result(act_home_goals, act_away_goals, home_goals, away_goals)
 
     def if_predicted_by_prev_matches(self, predictions):
-        total = 0
-        count = 0
-        for prediction in predictions.values():
-            for pred in prediction:
-                if pred["actual"] is None or pred["details"] is None:
-                    continue
-                if (
-                    pred["details"]["starting"]["description"]
-                    == "Previous match average"
-                ):
-                    if self.by_prev_matches(
-                        pred["actual"],
-                        pred["details"]["starting"]["homeGoals"],
-                        pred["details"]["starting"]["awayGoals"],
-                    ):
-                        count += 1
-                    total += 1
-        return count / total
-
-    def by_home_team(self, actual):
-        act_home_goals, act_away_goals = actual["homeGoals"], actual["awayGoals"]
+        flat = self._flatten_predictions(predictions)
+        mask = flat["byPrevMatches"]
+        # Compare whether comparison in goals scored by each team matches comparison in the average of their previous matches
+        return self._accuracy(
+            self.identical_results(
+                flat["actHomeGoals"][mask],
+                flat["actAwayGoals"][mask],
+                flat["prevHomeGoals"][mask],
+                flat["prevAwayGoals"][mask],
+            )
+        )
+
+    @staticmethod
+    def by_home_team(act_home_goals, act_away_goals):
         return act_home_goals > act_away_goals
 
-    def by_away_team(self, actual):
-        act_home_goals, act_away_goals = actual["homeGoals"], actual["awayGoals"]
+    @staticmethod
+    def by_away_team(act_home_goals, act_away_goals):
         return act_home_goals < act_away_goals
 
-    def by_draw(self, actual):
-        act_home_goals, act_away_goals = actual["homeGoals"], actual["awayGoals"]
+    @staticmethod
+    def by_draw(act_home_goals, act_away_goals):
         return act_home_goals == act_away_goals
 
     def if_predicted_by(self, predictions, by_function):
-        total = 0
-        count = 0
-        for prediction in predictions:
-            if prediction["actual"] is None:
-                continue
-            if by_function(prediction["actual"]):
-                count += 1
-            total += 1
-        return count / total
+        actual = [pred["actual"] for pred in predictions if pred["actual"] is not None]
+        act_home_goals = np.array([a["homeGoals"] for a in actual])
+        act_away_goals = np.array([a["awayGoals"] for a in actual])
+        return self._accuracy(by_function(act_home_goals, act_away_goals))
 
     def display_current_accuracy(self):
         print(self.database.get_accuracy())
@@ -139,44 +169,32 @@ class PredictionsAnalysis:
     def analyse_predictions(self):
         predictions = self.get_data()
 
-        # Home on x-axis, away on y-axis
-        xs = []
-        ys = []
-        ds = []
-        vs = []
-        count = 0
-        for pred in predictions:
-            if pred["actual"] is None:
-                continue
-            ph = pred["prediction"]["homeGoals"]
-            pa = pred["prediction"]["awayGoals"]
-            ah = pred["actual"]["homeGoals"]
-            aa = pred["actual"]["awayGoals"]
-
-            # Two points
-            x = (ph, ah)
-            y = (pa, aa)
-            xs.append(x)
-            ys.append(y)
-            vector = (ah - ph, aa - pa)
-            vs.append(vector)
-            distance = ((ph - ah) ** 2 + (pa - aa) ** 2) ** 0.5
-            ds.append(distance)
-            count += 1
-        print("n =", count)
+        actual = [pred for pred in predictions if pred["actual"] is not None]
+        ph = np.array([pred["prediction"]["homeGoals"] for pred in actual], dtype=float)
+        pa = np.array([pred["prediction"]["awayGoals"] for pred in actual], dtype=float)
+        ah = np.array([pred["actual"]["homeGoals"] for pred in actual], dtype=float)
+        aa = np.array([pred["actual"]["awayGoals"] for pred in actual], dtype=float)
+
+        ds = np.hypot(ph - ah, pa - aa)
+        print("n =", len(actual))
         print("Mean distance", np.mean(ds))
         print("S.d. distance", np.std(ds))
         print("Median distance", np.median(ds))
-        rv = np.mean([v[0] for v in vs]), np.mean([v[1] for v in vs])
+        rv = np.mean(ah - ph), np.mean(aa - pa)
         print("Resulting vector:", rv)
 
         _, ax = plt.subplots()
-        for x, y in zip(xs, ys):
-            ax.plot(x, y, "gray", linestyle="--")
-            # ax.scatter(x[0], y[0], c='r', s=20, marker='x')
-            ax.scatter(x[1], y[1], c="g", s=25, marker="x")  # Display actual score
-            ax.plot((0, rv[0]), (0, rv[1]), "blue", linestyle="solid")
-            ax.scatter(rv[0], rv[1], c="b", marker="x", s=25)
+        # Home on x-axis, away on y-axis
+        # Draw every prediction -> actual segment and actual score in one call each
+        predicted_points = np.column_stack((ph, pa))
+        actual_points = np.column_stack((ah, aa))
+        segments = np.stack((predicted_points, actual_points), axis=1)
+        ax.add_collection(LineCollection(segments, colors="gray", linestyles="--"))
+        # ax.scatter(ph, pa, c='r', s=20, marker='x')
+        ax.scatter(ah, aa, c="g", s=25, marker="x")  # Display actual score
+        ax.plot((0, rv[0]), (0, rv[1]), "blue", linestyle="solid")
+        ax.scatter(rv[0], rv[1], c="b", marker="x", s=25)
+        ax.autoscale_view()
 
         plt.show()
 
@@ -1,6 +1,7 @@
-from collections import defaultdict
 from datetime import datetime
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from fmt import clean_full_team_name, convert_team_name_or_initials
@@ -12,94 +13,114 @@ from .df import DF
 class Fixtures(DF):
     def __init__(self, d: DataFrame = DataFrame()):
         super().__init__(d, "fixtures")
-
-    @staticmethod
-    def _inc_avg_scored_conceded(
-        avg_scored: float, avg_conceded: float, score: dict[str, int], at_home: bool
+        # Parallel (teams x matchdays) arrays of the DataFrame's numeric fields,
+        # set alongside self.df for the getters to slice directly
+        self._team_rows: dict[str, int] = {}
+        self._finished: Optional[np.ndarray] = None
+        self._at_home: Optional[np.ndarray] = None
+        self._home_goals: Optional[np.ndarray] = None
+        self._away_goals: Optional[np.ndarray] = None
+        if self.df is not None:
+            self._set_arrays(self.df)
+
+    def _set_arrays(
+        self,
+        fixtures: DataFrame,
+        goals: Optional[tuple[np.ndarray, np.ndarray]] = None,
     ):
-        if at_home:
-            avg_scored += score["homeGoals"]
-            avg_conceded += score["awayGoals"]
-        else:
-            avg_scored += score["awayGoals"]
-            avg_conceded += score["homeGoals"]
-
-        return avg_scored, avg_conceded
+        self._team_rows = {team: i for i, team in enumerate(fixtures.index)}
+        status = fixtures.xs("status", axis=1, level=1).to_numpy()
+        self._finished = status == "FINISHED"
+        self._at_home = fixtures.xs("atHome", axis=1, level=1).to_numpy(dtype=bool)
+        if goals is None:
+            # Read the goals back out of the score dicts of a prebuilt DataFrame
+            scores = fixtures.xs("score", axis=1, level=1).to_numpy()
+            goals = (
+                np.zeros(scores.shape, dtype=np.int16),
+                np.zeros(scores.shape, dtype=np.int16),
+            )
+            for i, j in zip(*np.nonzero(self._finished)):
+                goals[0][i, j] = scores[i, j]["homeGoals"]
+                goals[1][i, j] = scores[i, j]["awayGoals"]
+        self._home_goals, self._away_goals = goals
 
     def get_avg_result(self, team: str):
-        avg_scored = 0.0
-        avg_conceded = 0.0
-        total = 0.0
-        for matchday_no in self.df.columns.unique(level=0):
-            if self.df.at[team, (matchday_no, "status")] != "FINISHED":
-                continue
-            at_home = self.df.at[team, (matchday_no, "atHome")]
-            score = self.df.at[team, (matchday_no, "score")]
-            avg_scored, avg_conceded = self._inc_avg_scored_conceded(
-                avg_scored, avg_conceded, score, at_home
-            )
-            total += 1
+        i = self._team_rows[team]
+        # Mask of the team's finished matchdays, selected together
+        finished = self._finished[i]
+        if not finished.any():
+            return 0.0, 0.0
 
-        if total > 0:
-            avg_scored = avg_scored / total
-            avg_conceded = avg_conceded / total
+        at_home = self._at_home[i, finished]
+        home_goals = self._home_goals[i, finished]
+        away_goals = self._away_goals[i, finished]
 
-        return avg_scored, avg_conceded
+        avg_scored = np.where(at_home, home_goals, away_goals).mean()
+        avg_conceded = np.where(at_home, away_goals, home_goals).mean()
+        return float(avg_scored), float(avg_conceded)
 
     def get_actual_scores_new(self):
         # To contain a tuple for all actual scores so far this season
         actual_scores: dict[tuple[str, str], dict[str, int]] = {}
 
-        for matchday_no in range(1, 39):
-            matchday = self.df[matchday_no]
-
-            # If whole column is SCHEDULED, skip
-            if all(matchday["status"] == "SCHEDULED"):
-                continue
-
-            for team, row in matchday.iterrows():
-                if row["status"] != "FINISHED":
-                    continue
-                if row["atHome"]:
-                    home_name = team
-                    away_name = row["team"]
-                else:
-                    home_name = row["team"]
-                    away_name = team
-                home_initials = convert_team_name_or_initials(home_name)
-                away_initials = convert_team_name_or_initials(away_name)
-
-                actual_scores[f"{home_initials} vs {away_initials}"] = row["score"]
+        # Visit only the finished matches, matchday by matchday
+        finished = self._finished
+        at_home = self._at_home
+        opposition = self.df.xs("team", axis=1, level=1).to_numpy()
+        scores = self.df.xs("score", axis=1, level=1).to_numpy()
+        teams = self.df.index.tolist()
+        for j, i in zip(*np.nonzero(finished.T)):
+            if at_home[i, j]:
+                home_name = teams[i]
+                away_name = opposition[i, j]
+            else:
+                home_name = opposition[i, j]
+                away_name = teams[i]
+            home_initials = convert_team_name_or_initials(home_name)
+            away_initials = convert_team_name_or_initials(away_name)
+
+            actual_scores[f"{home_initials} vs {away_initials}"] = scores[i, j]
 
         return actual_scores
 
     @staticmethod
-    def _insert_team_row(
-        matchday: int, match: dict, teams: list[str], home_team: bool
+    def _insert_match(
+        columns: dict[tuple[int, str], list],
+        rows: tuple[int, int],
+        match: dict,
+        date: datetime,
+        teams: tuple[str, str],
     ):
-        date = datetime.strptime(match["utcDate"], "%Y-%m-%dT%H:%M:%SZ")
-
-        if home_team:
-            team = clean_full_team_name(match["homeTeam"]["name"])
-            opposition = clean_full_team_name(match["awayTeam"]["name"])
-        else:
-            team = clean_full_team_name(match["awayTeam"]["name"])
-            opposition = clean_full_team_name(match["homeTeam"]["name"])
-
-        if match["score"]["fullTime"]["homeTeam"] is not None:
+        """Write a match into the home team's row and the away team's row,
+        reading its fields from the API match once for both."""
+        full_time = match["score"]["fullTime"]
+        if full_time["homeTeam"] is not None:
             score = {
-                "homeGoals": match["score"]["fullTime"]["homeTeam"],
-                "awayGoals": match["score"]["fullTime"]["awayTeam"],
+                "homeGoals": full_time["homeTeam"],
+                "awayGoals": full_time["awayTeam"],
             }
         else:
             score = None
 
-        matchday[(match["matchday"], "date")].append(date)
-        matchday[(match["matchday"], "atHome")].append(home_team)
-        matchday[(match["matchday"], "team")].append(opposition)
-        matchday[(match["matchday"], "status")].append(match["status"])
-        matchday[(match["matchday"], "score")].append(score)
-        teams.append(team)
+        matchday = match["matchday"]
+        date_col = columns[(matchday, "date")]
+        at_home_col = columns[(matchday, "atHome")]
+        team_col = columns[(matchday, "team")]
+        status_col = columns[(matchday, "status")]
+        score_col = columns[(matchday, "score")]
+        for row, opposition, at_home in zip(rows, reversed(teams), (True, False)):
+            date_col[row] = date
+            at_home_col[row] = at_home
+            team_col[row] = opposition
+            status_col[row] = match["status"]
+            score_col[row] = score
+
+    @staticmethod
+    def _clean_team_names(data: list[dict]):
+        # Raw API names repeat in every match, so clean each distinct name once
+        raw_names = {match["homeTeam"]["name"] for match in data}
+        raw_names.update(match["awayTeam"]["name"] for match in data)
+        return {name: clean_full_team_name(name) for name in raw_names}
 
     @timebudget
     def build(self, json_data: dict, season: int, display: bool = False):
@@ -133,40 +154,50 @@ class Fixtures(DF):
         """
         self.log_building(season)
 
-        data = json_data["fixtures"][season]
-
-        teams: list[str] = []
-        teams_index = []  # Specific order of team names to be DataFrame index
-        matchday: dict[tuple[int, str], list] = defaultdict(lambda: [])
-        matchdays: list[DataFrame] = []
-        prev_matchday = 0
-        for match in sorted(data, key=lambda x: x["matchday"]):
-            # If moved on to data for the next matchday, or
-            if prev_matchday < match["matchday"]:
-                # Package matchday dictionary into DataFrame to concatenate into main fixtures DataFrame
-                df_matchday = pd.DataFrame(matchday)
-                df_matchday.index = teams
-
-                matchday = defaultdict(lambda: [])
-                # If just finished matchday 1 data, take team name list order as main fixtures DataFrame index
-                if prev_matchday == 1:
-                    teams_index = teams[:]
-                matchdays.append(df_matchday)
-
-                prev_matchday = match["matchday"]
-                teams = []
-
-            self._insert_team_row(matchday, match, teams, True)
-            self._insert_team_row(matchday, match, teams, False)
-
-        # Add last matchday (38) DataFrame to list
-        df_matchday = pd.DataFrame(matchday)
-        df_matchday.index = teams
-        matchdays.append(df_matchday)
-
-        fixtures = pd.concat(matchdays, axis=1)
+        # Bucket matches by their matchday number in one pass instead of sorting
+        matchdays: dict[int, list[dict]] = {}
+        for match in json_data["fixtures"][season]:
+            matchdays.setdefault(match["matchday"], []).append(match)
+        matchday_nos = sorted(matchdays)
+        data = [match for n in matchday_nos for match in matchdays[n]]
+        names = self._clean_team_names(data)
+
+        # Take matchday 1 team name order as the DataFrame index
+        teams_index: list[str] = []
+        for match in matchdays[matchday_nos[0]]:
+            teams_index.append(names[match["homeTeam"]["name"]])
+            teams_index.append(names[match["awayTeam"]["name"]])
+        team_rows = {team: i for i, team in enumerate(teams_index)}
+
+        # Fill preallocated columns for every matchday by each team's row
+        # position, then build the DataFrame in one go
+        columns: dict[tuple[int, str], list] = {}
+        for n in matchday_nos:
+            for field in ("date", "atHome", "team", "status", "score"):
+                columns[(n, field)] = [None] * len(teams_index)
+
+        # Goals of finished matches, taken from the API values as each match
+        # is inserted rather than read back out of the score dicts later
+        matchday_cols = {n: j for j, n in enumerate(matchday_nos)}
+        home_goals = np.zeros((len(teams_index), len(matchday_nos)), dtype=np.int16)
+        away_goals = np.zeros_like(home_goals)
+
+        # Parse all match dates in one vectorised call
+        dates = pd.to_datetime(
+            [match["utcDate"] for match in data], format="%Y-%m-%dT%H:%M:%SZ"
+        ).to_pydatetime()
+        for match, date in zip(data, dates):
+            home_team = names[match["homeTeam"]["name"]]
+            away_team = names[match["awayTeam"]["name"]]
+            rows = (team_rows[home_team], team_rows[away_team])
+            self._insert_match(columns, rows, match, date, (home_team, away_team))
+            if match["status"] == "FINISHED":
+                j = matchday_cols[match["matchday"]]
+                home_goals[rows, j] = match["score"]["fullTime"]["homeTeam"]
+                away_goals[rows, j] = match["score"]["fullTime"]["awayTeam"]
+
+        fixtures = pd.DataFrame(columns, index=teams_index)
 
-        fixtures.index = teams_index
         fixtures.columns.names = ("matchday", None)
         fixtures.index.name = "team"
 
@@ -174,3 +205,4 @@ class Fixtures(DF):
             print(fixtures)
 
         self.df = fixtures
+        self._set_arrays(fixtures, (home_goals, away_goals))
@@ -1,3 +1,4 @@
+from bisect import bisect_left, insort
 from typing import Optional
 
 import numpy as np
@@ -9,10 +10,18 @@ from timebudget import timebudget
 from .df import DF
 from .team_ratings import TeamRatings
 
+# Form result characters for a negative, zero and positive goal difference
+_RESULT_CHARS = np.array(["L", "D", "W"])
+
 
 class Form(DF):
     def __init__(self, d: DataFrame = DataFrame()):
         super().__init__(d, "form")
+        self._last_played: Optional[dict[str, int]] = None
+        # (team rows, matchday columns, ratings) arrays per (season, n_games)
+        self._form_ratings: dict[
+            tuple[int, int], tuple[dict[str, int], dict[int, int], np.ndarray]
+        ] = {}
 
     def get_prev_matchday(self, current_season: int):
         current_season = self.get_current_season()
@@ -28,30 +37,44 @@ class Form(DF):
 
     def get_current_form_rating(self, team: str):
         current_season = self.get_current_season()
-        current_matchday = self.get_current_matchday(current_season)
-        matchday = self._get_last_played_matchday(
-            current_matchday, current_season, team
-        )
+        matchday = self._get_last_played_matchday(team)
         return self._get_form_rating(team, matchday, current_season, 5)
 
     def get_long_term_form_rating(self, team: str):
         current_season = self.get_current_season()
-        current_matchday = self.get_current_matchday(current_season)
-        matchday = self._get_last_played_matchday(
-            current_matchday, current_season, team
-        )
+        matchday = self._get_last_played_matchday(team)
         return self._get_form_rating(team, matchday, current_season, 10)
 
-    def _get_last_played_matchday(
-        self, current_matchday: int, current_season: int, team: str
-    ):
-        matchday = current_matchday
-        while (
-            matchday > 0
-            and self.df.at[team, (current_season, matchday, "score")] is None
-        ):
-            matchday -= 1
-        return matchday
+    def _last_played_matchdays(self):
+        # Latest current season matchday with a score for every team, from one
+        # pass over the score columns
+        current_season = self.get_current_season()
+        scores = self.df[current_season].xs("score", axis=1, level=1)
+        played = np.not_equal(scores.to_numpy(), None)
+        matchdays = np.append(scores.columns.to_numpy(), 0)
+        # Index of each row's last played column, falling back to matchday 0
+        last = np.where(
+            played.any(axis=1), played.shape[1] - 1 - played[:, ::-1].argmax(axis=1), -1
+        )
+        return dict(zip(scores.index, matchdays[last].tolist()))
+
+    def _get_last_played_matchday(self, team: str):
+        if self._last_played is None:
+            self._last_played = self._last_played_matchdays()
+        return self._last_played[team]
+
+    def _form_rating_arrays(self, season: int, n_games: int):
+        key = (season, n_games)
+        if key not in self._form_ratings:
+            # Pull the season's form rating columns out once as a float array
+            # indexed by team row and matchday column
+            ratings = self.df[season].xs(f"formRating{n_games}", axis=1, level=1)
+            self._form_ratings[key] = (
+                {team: i for i, team in enumerate(ratings.index)},
+                {matchday: j for j, matchday in enumerate(ratings.columns)},
+                ratings.to_numpy(dtype=float),
+            )
+        return self._form_ratings[key]
 
     def _get_form_rating(
         self, team: str, matchday: int, current_season: int, n_games: int
@@ -62,38 +85,50 @@ class Form(DF):
         if matchday is None:
             return 50.0
 
-        rating = (
-            self.df.at[team, (current_season, matchday, f"formRating{n_games}")] * 100
-        ).round(1)
+        team_rows, matchday_cols, ratings = self._form_rating_arrays(
+            current_season, n_games
+        )
+        rating = (ratings[team_rows[team], matchday_cols[matchday]] * 100).round(1)
         return rating
 
     def _get_matchday(self, season: int, n_back: int = 0):
         current_matchday = 0
-        matchdays = self.df[season].columns.unique(level=0)
+        # Read the season's matchday labels straight off the column index
+        # rather than slicing out the season's sub-frame
+        columns = self.df.columns
+        in_season = columns.get_level_values(0) == season
+        matchdays = columns.get_level_values(1)[in_season].unique()
         if len(matchdays) != 0:
             current_matchday = matchdays[-(n_back + 1)]
         return current_matchday
 
     @staticmethod
-    def _get_points(gd: int):
-        if gd > 0:
-            return 3
-        elif gd == 0:
-            return 1
-        return 0
-
-    @staticmethod
-    def _get_gd(score: str, at_home: bool):
-        if at_home:
-            return score["homeGoals"] - score["awayGoals"]
-        return score["awayGoals"] - score["homeGoals"]
+    def _season_results(matches: list[dict]):
+        """Goal difference, points and W, D or L result character of the home
+        and away team for every finished match of a season, computed together
+        as arrays."""
+        home_goals = np.array(
+            [m["score"]["fullTime"]["homeTeam"] for m in matches], dtype=int
+        )
+        away_goals = np.array(
+            [m["score"]["fullTime"]["awayTeam"] for m in matches], dtype=int
+        )
+        home_gds = home_goals - away_goals
+        home_points = np.select([home_gds > 0, home_gds == 0], [3, 1], 0)
+        away_points = np.select([home_gds < 0, home_gds == 0], [3, 1], 0)
+        # Index "LDW" by the sign of the goal difference
+        home_results = _RESULT_CHARS[np.sign(home_gds) + 1]
+        away_results = _RESULT_CHARS[np.sign(-home_gds) + 1]
+        home = zip(home_gds.tolist(), home_points.tolist(), home_results.tolist())
+        away = zip((-home_gds).tolist(), away_points.tolist(), away_results.tolist())
+        return list(home), list(away)
 
     @staticmethod
     def _calc_form_rating(
-        team_ratings: TeamRatings,
-        teams_played: list[str],
+        ratings: dict[str, float],
+        teams_played: tuple[str, ...],
         form_str: str,
-        gds: list[int],
+        gds: tuple[int, ...],
     ):
         form_rating = 0.5  # Default percentage, moves up or down based on performance
 
@@ -102,9 +137,7 @@ class Form(DF):
 
         for i, opposition in enumerate(teams_played):
             # Convert opposition team initials to their name
-            opposition_rating = 0
-            if opposition in team_ratings.df.index:
-                opposition_rating = team_ratings.df.at[opposition, "total"]
+            opposition_rating = ratings.get(opposition, 0)
 
             # Increment form score based on rating of the team they've won, drawn or lost against
             form_rating += (opposition_rating / len(form_str)) * gds[i]
@@ -113,22 +146,36 @@ class Form(DF):
         return form_rating
 
     def _insert_position_columns(self, df: DataFrame):
-        seasons = df.columns.unique(level=0).tolist()
-        for season in seasons:
-            played_matchdays = df[season].columns.unique(level=0).tolist()
-            for matchday in played_matchdays:
-                df = df.sort_values(
-                    by=[(season, matchday, "cumPoints"), (season, matchday, "cumGD")],
-                    ascending=False,
-                )
-                df[(season, matchday, "position")] = list(range(1, 21))
-        return df
+        # Rank the table at each matchday by stable sorting the order of the
+        # matchday before, so tied teams keep their previous relative order,
+        # then add every position column and reorder the rows once at the end
+        order = np.arange(len(df))
+        positions: dict[tuple[int, int, str], np.ndarray] = {}
+        # Pull the cumulative blocks out once, with each (season, matchday)
+        # column's position, rather than resolving three level labels per column
+        cum_points = df.xs("cumPoints", axis=1, level=2)
+        cum_gd = df.xs("cumGD", axis=1, level=2)
+        points_cols = {col: j for j, col in enumerate(cum_points.columns)}
+        gd_cols = {col: j for j, col in enumerate(cum_gd.columns)}
+        cum_points = cum_points.to_numpy(dtype=float)
+        cum_gd = cum_gd.to_numpy(dtype=float)
+        levels = df.columns.droplevel(2).unique()
+        for season in df.columns.unique(level=0).tolist():
+            played_matchdays = levels[levels.get_level_values(0) == season]
+            for matchday in played_matchdays.get_level_values(1).tolist():
+                points = cum_points[:, points_cols[(season, matchday)]]
+                gd = cum_gd[:, gd_cols[(season, matchday)]]
+                order = order[np.lexsort((-gd[order], -points[order]))]
+                position = np.empty(len(order), dtype=np.int64)
+                position[order] = np.arange(1, len(order) + 1)
+                positions[(season, matchday, "position")] = position
+        df = pd.concat((df, pd.DataFrame(positions, index=df.index)), axis=1)
+        return df.iloc[order]
 
     def _fill_teams_missing_matchday(self, form: DataFrame):
         """Fill in missing essential matchday data with copies from previous matchday."""
         current_season = max(form.columns.unique(level=0))
         matchdays = list(sorted(form[current_season].columns.unique(level=0)))
-        teams = form[current_season].index.values
         essential_cols = (
             "cumGD",
             "cumPoints",
@@ -137,43 +184,28 @@ class Form(DF):
             "formRating5",
             "formRating10",
         )
-        for matchday in matchdays:
-            if not form[current_season][matchday].isnull().values.any():
+        # Matchdays with any missing value, found from one isnull pass
+        has_null = form[current_season].isnull().any(axis=0).groupby(level=0).any()
+        for prev_matchday, matchday in zip(matchdays, matchdays[1:]):
+            if not has_null[matchday]:
                 continue
 
-            for team in teams:
-                # value = form.at[team, (current_season, matchday, "team")]
-                # print(value)
-                # if isinstance(value, float) or not math.isnan(value):
-                #     continue
-                # Team does not have a completed match in this matchday (postponed etc.)
-                prev_matchday = matchday - 1
-                while prev_matchday > 0 and prev_matchday not in matchdays:
-                    prev_matchday -= 1
-                if prev_matchday == 0:
-                    continue
-                for col in essential_cols:
-                    form.at[team, (current_season, matchday, col)] = form.at[
-                        team, (current_season, prev_matchday, col)
-                    ]
+            # A team does not have a completed match in this matchday (postponed
+            # etc.), copy the previous matchday's columns for all teams at once
+            cols = [(current_season, matchday, col) for col in essential_cols]
+            prev_cols = [(current_season, prev_matchday, col) for col in essential_cols]
+            form.loc[:, cols] = form.loc[:, prev_cols].to_numpy()
 
     def _clean_dataframe(self, form: DataFrame, matchday_nos: list[int]):
-        # Drop columns used for working
-        form = form.drop(columns=["points"], level=1)
-        form = form.reindex(sorted(form.columns.values), axis=1)
+        # Select the final columns, without those used for working, in sorted
+        # order with a single selection
+        columns = form.columns[form.columns.get_level_values(1) != "points"]
+        form = form[columns.sort_values()]
         form = form.sort_values(
             by=[(max(matchday_nos), "formRating5")], ascending=False
         )
         return form
 
-    @staticmethod
-    def _get_form_char(gd: int):
-        if gd > 0:
-            return "W"
-        elif gd < 0:
-            return "L"
-        return "D"
-
     def _last_n_played_matchdays(self, d: dict, team: str, current_season: int, N: int):
         played_matchdays = []
         for matchday in range(38, 0, -1):
@@ -185,54 +217,40 @@ class Form(DF):
         played_matchdays.reverse()
         return played_matchdays
 
-    def calc_form_rating(
+    def _insert_form_ratings(
         self,
         d: dict,
-        team_ratings: TeamRatings,
-        team: str,
-        current_season: int,
-        matchdays: list[int],
-        length: int,
-    ):
-        # played_matchdays = self._last_n_played_matchdays(
-        # d, team, current_season, length)
-        played_matchdays = matchdays[-min(length, len(matchdays)) :]
-        teams_played = [
-            d[team][(current_season, matchday, "team")] for matchday in played_matchdays
-        ]
-        gds = [
-            d[team][(current_season, matchday, "gD")] for matchday in played_matchdays
-        ]
-        form_str = d[team][(current_season, played_matchdays[-1], f"form{length}")]
-        form_rating = self._calc_form_rating(team_ratings, teams_played, form_str, gds)
-        return form_rating
-
-    def _insert_form_rating(
-        self,
-        d: dict,
-        team_ratings: TeamRatings,
+        ratings: dict[str, float],
         team: str,
         season: int,
         ordered_matchdays: list[int],
-        length: int,
     ):
-        form_rating = self.calc_form_rating(
-            d, team_ratings, team, season, ordered_matchdays, length
-        )
+        # Gather the opposition and goal difference of each game in the 10 game
+        # window once, and rate the 5 game form from the end of the same window
+        team_values = d[team]
+        window = ordered_matchdays[-10:]
+        teams_played = tuple(team_values[(season, md, "team")] for md in window)
+        gds = tuple(team_values[(season, md, "gD")] for md in window)
         matchday = ordered_matchdays[-1]
-        d[team][(season, matchday, f"formRating{length}")] = form_rating
+        for length in (5, 10):
+            n_games = min(length, len(window))
+            form_str = team_values[(season, matchday, f"form{length}")]
+            team_values[(season, matchday, f"formRating{length}")] = (
+                self._calc_form_rating(
+                    ratings, teams_played[-n_games:], form_str, gds[-n_games:]
+                )
+            )
 
     def _insert_form_string(
         self,
         d: dict,
         team: str,
-        gd: int,
+        form_char: str,
         season: int,
         ordered_matchdays: list[int],
         length: int,
     ):
         col_heading = f"form{length}"
-        form_char = self._get_form_char(gd)  # W, L or D for matchday
 
         if len(ordered_matchdays) > 1:
             prev_matchday = ordered_matchdays[-2]
@@ -247,36 +265,35 @@ class Form(DF):
         d[team][(season, matchday, col_heading)] = form_str
 
     @staticmethod
-    def _prev_matchday(d: dict, team: str, matchday: int, season: int):
-        prev_matchday = matchday - 1
-        while (season, prev_matchday, "team") not in d[team] and prev_matchday >= 0:
-            prev_matchday -= 1
-        if prev_matchday < 0:
-            prev_matchday = None
-        return prev_matchday
-
-    def _ordered_played_matchdays(self, d: dict, team: str, season: int):
-        played_matchdays: list[tuple[int, str]] = []
-        for matchday in range(1, 39):
-            if (season, matchday, "date") in d[team]:
-                played_matchdays.append((matchday, d[team][(season, matchday, "date")]))
-
-        # Sort by date
-        played_matchdays.sort(key=lambda x: x[1])
-
-        # Collect ordered matchday numbers to return
-        ordered_matchdays: list[int] = []
-        for matchday in played_matchdays:
-            ordered_matchdays.append(matchday[0])
-        return ordered_matchdays
+    def _ordered_played_matchdays(
+        played: dict[tuple[str, int], list[tuple[str, int]]],
+        team: str,
+        season: int,
+        matchday: int,
+        date: str,
+        prev_date: Optional[str],
+    ):
+        """Record a newly played matchday in the team's (date, matchday) list
+        for the season, kept sorted as matches are inserted, and return the
+        team's matchday numbers in date order."""
+        played_matchdays = played.setdefault((team, season), [])
+        if prev_date is not None:
+            # Matchday replayed, drop its earlier entry found by binary search
+            del played_matchdays[bisect_left(played_matchdays, (prev_date, matchday))]
+        insort(played_matchdays, (date, matchday))
+        return [played_matchday for _, played_matchday in played_matchdays]
 
     def _insert_team_matchday(
         self,
         d: dict,
         match: dict,
-        team_ratings: TeamRatings,
+        ratings: dict[str, float],
+        played: dict[tuple[str, int], list[tuple[str, int]]],
         season: int,
         home_team: bool,
+        gd: int,
+        points: int,
+        form_char: str,
     ):
         if home_team:
             team = clean_full_team_name(match["homeTeam"]["name"])
@@ -289,6 +306,7 @@ class Form(DF):
             d[team] = {}
 
         matchday = match["matchday"]
+        prev_date = d[team].get((season, matchday, "date"))
 
         d[team][(season, matchday, "team")] = opposition
         d[team][(season, matchday, "date")] = match["utcDate"]
@@ -299,44 +317,33 @@ class Form(DF):
             "awayGoals": match["score"]["fullTime"]["awayTeam"],
         }
         d[team][(season, matchday, "score")] = score
-
-        gd = self._get_gd(score, home_team)
-        points = self._get_points(gd)
         d[team][(season, matchday, "gD")] = gd
         d[team][(season, matchday, "points")] = points
 
-        ordered_matchdays = self._ordered_played_matchdays(d, team, season)
-        self._insert_form_string(d, team, gd, season, ordered_matchdays, 5)
-        self._insert_form_string(d, team, gd, season, ordered_matchdays, 10)
+        ordered_matchdays = self._ordered_played_matchdays(
+            played, team, season, matchday, match["utcDate"], prev_date
+        )
+        self._insert_form_string(d, team, form_char, season, ordered_matchdays, 5)
+        self._insert_form_string(d, team, form_char, season, ordered_matchdays, 10)
 
-        self._insert_form_rating(d, team_ratings, team, season, ordered_matchdays, 5)
-        self._insert_form_rating(d, team_ratings, team, season, ordered_matchdays, 10)
+        self._insert_form_ratings(d, ratings, team, season, ordered_matchdays)
 
     def _insert_cumulative(self, d: dict, season: int):
         # Insert cumulative by taking previous numerical matchday, rather than
         # previous played game by date due to matchday number on x-axis of points
-        # and played graphs
-        for team in d.keys():
+        # and played graphs, as running totals over each team's played matchdays
+        for team_matchday in d.values():
+            cum_points = 0
+            cum_gd = 0
             for matchday in range(1, 39):
-                team_matchday = d[team]
                 # Skip if matchday not played
                 if (season, matchday, "points") not in team_matchday:
                     continue
 
-                points = team_matchday[(season, matchday, "points")]
-                gd = team_matchday[(season, matchday, "gD")]
-
-                prev_cum_points = 0
-                prev_cum_gd = 0
-                if matchday > 1:
-                    prev_matchday = self._prev_matchday(d, team, matchday, season)
-                    prev_cum_points = d[team][(season, prev_matchday, "cumPoints")]
-                    prev_cum_gd = d[team][(season, prev_matchday, "cumGD")]
-
-                team_matchday[(season, matchday, "cumPoints")] = (
-                    prev_cum_points + points
-                )
-                team_matchday[(season, matchday, "cumGD")] = prev_cum_gd + gd
+                cum_points += team_matchday[(season, matchday, "points")]
+                cum_gd += team_matchday[(season, matchday, "gD")]
+                team_matchday[(season, matchday, "cumPoints")] = cum_points
+                team_matchday[(season, matchday, "cumGD")] = cum_gd
 
     @staticmethod
     def _init_missing_teams(d: dict, teams: list[str]):
@@ -400,19 +407,29 @@ class Form(DF):
         """
         self.log_building(season)
 
+        # Total rating of each team, looked up for every opposition played
+        ratings = team_ratings.df["total"].to_dict()
+
         d = {}
+        # Each team's played (date, matchday) pairs per season, in date order
+        played: dict[tuple[str, int], list[tuple[str, int]]] = {}
         teams = set()
         for i in range(num_seasons):
-            for match in json_data["fixtures"][season - i]:
-                if i == 0:
-                    # Build list of teams in current season
+            matches = json_data["fixtures"][season - i]
+            if i == 0:
+                # Build list of teams in current season
+                for match in matches:
                     teams.add(clean_full_team_name(match["homeTeam"]["name"]))
                     teams.add(clean_full_team_name(match["awayTeam"]["name"]))
-                if match["status"] == "FINISHED":
-                    self._insert_team_matchday(d, match, team_ratings, season - i, True)
-                    self._insert_team_matchday(
-                        d, match, team_ratings, season - i, False
-                    )
+
+            finished = [match for match in matches if match["status"] == "FINISHED"]
+            for match, home, away in zip(finished, *self._season_results(finished)):
+                self._insert_team_matchday(
+                    d, match, ratings, played, season - i, True, *home
+                )
+                self._insert_team_matchday(
+                    d, match, ratings, played, season - i, False, *away
+                )
 
             # Create cumulative points and goal difference fields now points for
             # all matchdays entered
@@ -423,7 +440,7 @@ class Form(DF):
         form = pd.DataFrame.from_dict(d, orient="index")
 
         # Drop teams not in current season
-        form = form.drop(index=form.index.difference(teams), axis=0)
+        form = form[form.index.isin(teams)]
 
         self._fill_teams_missing_matchday(form)
 
@@ -435,3 +452,5 @@ class Form(DF):
             print(form)
 
         self.df = form
+        self._last_played = None
+        self._form_ratings = {}
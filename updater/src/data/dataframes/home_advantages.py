@@ -1,6 +1,8 @@
 import logging
 from collections import defaultdict
+from itertools import chain
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from fmt import clean_full_team_name
@@ -14,79 +16,77 @@ class HomeAdvantages(DF):
         super().__init__(d, "home_advantages")
 
     @staticmethod
-    def _check_init_team_row(d: defaultdict, team: str, season: int):
-        if team not in d:
-            d[team] = {}
+    def _home_advantages_for_season(d: defaultdict, data: dict, season: int):
+        home_teams = [clean_full_team_name(match["homeTeam"]["name"]) for match in data]
+        away_teams = [clean_full_team_name(match["awayTeam"]["name"]) for match in data]
+        # Every team with a fixture, in order of first appearance
+        teams = list(dict.fromkeys(chain.from_iterable(zip(home_teams, away_teams))))
+        team_rows = {team: i for i, team in enumerate(teams)}
+
+        # Sign of the goal difference of each finished match: 1 for a home win,
+        # 0 for a draw and -1 for an away win
+        finished = [
+            i for i, match in enumerate(data) if match["score"]["winner"] is not None
+        ]
+        results = np.sign(
+            np.array(
+                [
+                    data[i]["score"]["fullTime"]["homeTeam"]
+                    - data[i]["score"]["fullTime"]["awayTeam"]
+                    for i in finished
+                ],
+                dtype=int,
+            )
+        )
+        home_rows = np.array([team_rows[home_teams[i]] for i in finished], dtype=int)
+        away_rows = np.array([team_rows[away_teams[i]] for i in finished], dtype=int)
+
+        # Tally results into (wins, draws, loses) columns for each side at once
+        home_counts = np.zeros((len(teams), 3), dtype=int)
+        away_counts = np.zeros((len(teams), 3), dtype=int)
+        np.add.at(home_counts, (home_rows, 1 - results), 1)
+        np.add.at(away_counts, (away_rows, 1 + results), 1)
 
-        if (season, "home", "wins") not in d[team]:
-            d[team].update(
+        for team, home, away in zip(teams, home_counts.tolist(), away_counts.tolist()):
+            d.setdefault(team, {}).update(
                 {
-                    (season, "home", "wins"): 0,
-                    (season, "home", "draws"): 0,
-                    (season, "home", "loses"): 0,
-                    (season, "away", "wins"): 0,
-                    (season, "away", "draws"): 0,
-                    (season, "away", "loses"): 0,
+                    (season, "home", "wins"): home[0],
+                    (season, "home", "draws"): home[1],
+                    (season, "home", "loses"): home[2],
+                    (season, "away", "wins"): away[0],
+                    (season, "away", "draws"): away[1],
+                    (season, "away", "loses"): away[2],
                 }
             )
 
-    def _home_advantages_for_season(self, d: defaultdict, data: dict, season: int):
-        for match in data:
-            home_team = clean_full_team_name(match["homeTeam"]["name"])
-            away_team = clean_full_team_name(match["awayTeam"]["name"])
-
-            self._check_init_team_row(d, home_team, season)
-            self._check_init_team_row(d, away_team, season)
-
-            if match["score"]["winner"] is None:
-                continue
-
-            home_goals = match["score"]["fullTime"]["homeTeam"]
-            away_goals = match["score"]["fullTime"]["awayTeam"]
-            if home_goals > away_goals:
-                # Home team wins
-                d[home_team][(season, "home", "wins")] += 1
-                d[away_team][(season, "away", "loses")] += 1
-            elif home_goals < away_goals:
-                # Away team wins
-                d[home_team][(season, "home", "loses")] += 1
-                d[away_team][(season, "away", "wins")] += 1
-            else:
-                # Draw
-                d[home_team][(season, "home", "draws")] += 1
-                d[away_team][(season, "away", "draws")] += 1
-
     @staticmethod
-    def _create_season_home_advantage_col(home_advantages: DataFrame, season: int):
-        played_at_home = (
-            home_advantages[season]["home"]["wins"]
-            + home_advantages[season]["home"]["draws"]
-            + home_advantages[season]["home"]["loses"]
+    def _season_home_advantage_cols(home_advantages: DataFrame, season: int):
+        home_wins, home_draws, home_loses, away_wins, away_draws, away_loses = (
+            home_advantages[(season, side, result)].to_numpy()
+            for side in ("home", "away")
+            for result in ("wins", "draws", "loses")
         )
-        home_advantages[season, "home", "played"] = played_at_home
-
-        # Percentage wins at home = total wins at home / total games played at home
-        win_ratio_at_home = home_advantages[season]["home"]["wins"] / played_at_home
-        home_advantages[season, "home", "winRatio"] = win_ratio_at_home
-
-        played = (
-            played_at_home
-            + home_advantages[season]["away"]["wins"]
-            + home_advantages[season]["away"]["draws"]
-            + home_advantages[season]["away"]["loses"]
-        )
-        home_advantages[season, "overall", "played"] = played
-
-        # Percentage wins = total wins / total games played
-        win_ratio = (
-            home_advantages[season]["home"]["wins"]
-            + home_advantages[season]["away"]["wins"]
-        ) / played
-        home_advantages[season, "overall", "winRatio"] = win_ratio
+        played_at_home = home_wins + home_draws + home_loses
+        played = played_at_home + away_wins + away_draws + away_loses
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Percentage wins at home = total wins at home / total games played at home
+            win_ratio_at_home = home_wins / played_at_home
+            # Percentage wins = total wins / total games played
+            win_ratio = (home_wins + away_wins) / played
 
         # home advantage = percentage wins at home - percentage wins
         home_advantage = win_ratio_at_home - win_ratio
-        home_advantages[season, "homeAdvantage", ""] = home_advantage
+
+        return pd.DataFrame(
+            {
+                (season, "home", "played"): played_at_home,
+                (season, "home", "winRatio"): win_ratio_at_home,
+                (season, "overall", "played"): played,
+                (season, "overall", "winRatio"): win_ratio,
+                (season, "homeAdvantage", ""): home_advantage,
+            },
+            index=home_advantages.index,
+        )
 
     @staticmethod
     def _create_total_home_advantage_col(
@@ -206,9 +206,16 @@ class HomeAdvantages(DF):
         home_advantages = pd.DataFrame.from_dict(d, orient="index")
         home_advantages = home_advantages.fillna(0).astype(int)
 
-        # Calculate home advantages for each season
-        for i in range(no_seasons):
-            self._create_season_home_advantage_col(home_advantages, season - i)
+        # Calculate home advantages for each season, adding all their columns
+        # in one concat
+        home_advantages = pd.concat(
+            [home_advantages]
+            + [
+                self._season_home_advantage_cols(home_advantages, season - i)
+                for i in range(no_seasons)
+            ],
+            axis=1,
+        )
 
         # Create the final overall home advantage value for each team
         home_advantages = self._create_total_home_advantage_col(
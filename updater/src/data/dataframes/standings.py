@@ -5,6 +5,42 @@ from timebudget import timebudget
 
 from .df import DF
 
+# API table fields, in the order of the column headings they are stored under
+_API_FIELDS = (
+    "position",
+    "playedGames",
+    "won",
+    "draw",
+    "lost",
+    "points",
+    "goalsFor",
+    "goalsAgainst",
+    "goalDifference",
+)
+_COL_HEADINGS = (
+    "position",
+    "played",
+    "won",
+    "drawn",
+    "lost",
+    "points",
+    "gF",
+    "gA",
+    "gD",
+)
+# Narrowest integer type holding each column's values across a 38 game season
+_COL_DTYPES = {
+    "position": "int8",
+    "played": "int8",
+    "won": "int8",
+    "drawn": "int8",
+    "lost": "int8",
+    "points": "int16",
+    "gF": "int16",
+    "gA": "int16",
+    "gD": "int16",
+}
+
 
 class Standings(DF):
     def __init__(self, d: DataFrame = DataFrame()):
@@ -16,35 +52,26 @@ class Standings(DF):
         teams = [clean_full_team_name(row["team"]["name"]) for row in data]
         return teams
 
-    def _season_standings(self, json_data: dict, current_teams: list[str], season: int):
+    def _season_standings(self, json_data: dict, current_teams: set[str], season: int):
         data = json_data["standings"][season]
-        df = pd.DataFrame.from_dict(data)
-
-        # Rename teams to their team name
-        teams = self.get_team_names(json_data, season) 
-        df = df.drop(columns=["form", "team"])
-        df.index = teams
-
-        col_headings = [
-            "position",
-            "played",
-            "won",
-            "drawn",
-            "lost",
-            "points",
-            "gF",
-            "gA",
-            "gD",
-        ]
-        df.columns = pd.MultiIndex.from_product([[season], col_headings])
-
-        df = df.drop(index=df.index.difference(current_teams))
+
+        # Take each team's row of values straight from the API table, in
+        # column heading order, and build the DataFrame in a single call
+        df = pd.DataFrame(
+            [[row[field] for field in _API_FIELDS] for row in data],
+            index=self.get_team_names(json_data, season),
+            columns=_COL_HEADINGS,
+        )
+
+        df = df[df.index.isin(current_teams)]
 
         return df
 
     @staticmethod
     def clean_dataframe(standings: DataFrame):
-        standings = standings.fillna(0).astype(int)
+        standings = standings.fillna(0).astype(
+            {col: _COL_DTYPES[col[1]] for col in standings.columns}
+        )
         standings.index.name = "team"
         standings.columns.names = ("Season", None)
         return standings
@@ -86,14 +113,16 @@ class Standings(DF):
         """
         self.log_building(season)
 
-        standings = pd.DataFrame()
-
-        teams = self.get_team_names(json_data, season)
+        teams = set(self.get_team_names(json_data, season))
 
-        # Loop from current season to the season 2 years ago
-        for n in range(num_seasons):
-            season_standings = self._season_standings(json_data, teams, season - n)
-            standings = pd.concat((standings, season_standings), axis=1)
+        # Join current season to the season [num_seasons] years ago in one
+        # concat, keyed by season to build the column multi-index once
+        seasons = [season - n for n in range(num_seasons)]
+        standings = pd.concat(
+            [self._season_standings(json_data, teams, s) for s in seasons],
+            axis=1,
+            keys=seasons,
+        )
 
         standings = self.clean_dataframe(standings)
 
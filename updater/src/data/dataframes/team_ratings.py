@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -18,11 +19,12 @@ class TeamRatings(DF):
         return points + gd
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def _get_season_weightings(no_seasons: int):
         mult = 2.5  # High = recent weighted more
         season_weights = [0.01 * (mult**3), 0.01 * (mult**2), 0.01 * mult, 0.01]
         weights = np.array(season_weights[:no_seasons])
-        return list(weights / sum(weights))  # Normalise list
+        return tuple(weights / sum(weights))  # Normalise, immutable for the cache
 
     def _calc_total_rating_col(
         self,
@@ -31,7 +33,6 @@ class TeamRatings(DF):
         include_current_season: bool,
     ):
         # Calculate total rating column
-        team_ratings["total"] = 0
         if include_current_season:
             start_n = 0  # Include current season when calculating total rating
             w = self._get_season_weightings(no_seasons)  # Column weights
@@ -39,50 +40,31 @@ class TeamRatings(DF):
             start_n = 1  # Exclude current season when calculating total rating
             w = self._get_season_weightings(no_seasons - 1)  # Column weights
 
-        for n in range(start_n, no_seasons):
-            team_ratings["total"] += (
-                w[n - start_n] * team_ratings[f"prevSeason{n}"]
-            )
-
-    @staticmethod
-    def init_rating_columns(team_ratings: DataFrame, num_seasons: int):
-        # Create column for each included season
-        for n in range(0, num_seasons):
-            team_ratings[f"prevSeason{n}"] = np.nan
+        # Weighted sum of the season columns as one matrix-vector product
+        cols = [f"prevSeason{n}" for n in range(start_n, no_seasons)]
+        team_ratings["total"] = team_ratings[cols].to_numpy() @ np.array(w)
 
-    def insert_rating_values(
-        self,
-        team_ratings: DataFrame,
-        standings: Standings,
-        current_season: int,
-        num_seasons: int,
+    def rating_values(
+        self, standings: Standings, current_season: int, num_seasons: int
     ):
-        for team, row in standings.df.iterrows():
-            for n in range(num_seasons):
-                rating = self._calc_rating(
-                    row[current_season - n]["points"], row[current_season - n]["gD"]
-                )
-                team_ratings.at[team, f"prevSeason{n}"] = rating
+        # Rate every team in every season at once from (teams x seasons) matrices
+        seasons = [current_season - n for n in range(num_seasons)]
+        points = standings.df.loc[:, [(s, "points") for s in seasons]].to_numpy()
+        gd = standings.df.loc[:, [(s, "gD") for s in seasons]].to_numpy()
+        return self._calc_rating(points, gd).astype(float)
 
     @staticmethod
     def replace_nan(team_ratings: DataFrame):
         # Replace any NaN with the lowest rating in the same column
-        for col in team_ratings.columns:
-            team_ratings[col] = team_ratings[col].replace(
-                np.nan, team_ratings[col].min()
-            )
+        team_ratings.fillna(team_ratings.min(), inplace=True)
 
     @staticmethod
     def normalise_ratings(team_ratings: DataFrame, num_seasons: int):
-        # Create normalised versions of the three ratings columns
-        for n in range(0, num_seasons):
-            col_heading = f"prevSeason{n}"
-            team_ratings[col_heading] = (
-                team_ratings[col_heading] - team_ratings[col_heading].min()
-            ) / (
-                team_ratings[col_heading].max()
-                - team_ratings[col_heading].min()
-            )
+        # Min-max normalise all season rating columns together
+        cols = [f"prevSeason{n}" for n in range(0, num_seasons)]
+        ratings = team_ratings[cols]
+        col_min = ratings.min()
+        team_ratings[cols] = (ratings - col_min) / (ratings.max() - col_min)
 
     @staticmethod
     def include_current_season(
@@ -144,11 +126,12 @@ class TeamRatings(DF):
         self.log_building(season)
         self._check_dependencies(standings)
 
-        # Add current season team names to the object team DataFrame
-        team_ratings = pd.DataFrame(index=standings.df.index)
-
-        self.init_rating_columns(team_ratings, num_seasons)
-        self.insert_rating_values(team_ratings, standings, season, num_seasons)
+        # Create column for each included season for current season teams
+        team_ratings = pd.DataFrame(
+            self.rating_values(standings, season, num_seasons),
+            index=standings.df.index,
+            columns=[f"prevSeason{n}" for n in range(num_seasons)],
+        )
         self.replace_nan(team_ratings)
         self.normalise_ratings(team_ratings, num_seasons)
         include_cs = self.include_current_season(standings, season, games_threshold)
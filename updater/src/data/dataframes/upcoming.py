@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from fmt import clean_full_team_name, convert_team_name_or_initials
@@ -13,6 +14,31 @@ from .form import Form
 from .home_advantages import HomeAdvantages
 from .team_ratings import TeamRatings
 
+# Month names indexed by month number
+_MONTHS = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Ordinal suffix of each day of the month, indexed by day number
+_DAY_SUFFIXES = tuple(
+    "th" if 4 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    for n in range(32)
+)
+# Team's result for a negative, zero and positive goal difference
+_RESULTS = ("lost", "drew", "won")
+
 
 class Upcoming(DF):
     def __init__(self, d: DataFrame = DataFrame()):
@@ -40,48 +66,65 @@ class Upcoming(DF):
         if "prediction" not in self.df:
             return predictions
 
-        for team, row in self.df.iterrows():
-            if row["atHome"]:
+        # Walk the columns side by side rather than boxing each row as a Series
+        rows = zip(
+            self.df.index,
+            self.df["date"],
+            self.df["team"],
+            self.df["atHome"],
+            self.df["prediction"],
+        )
+        for team, date, opposition, at_home, prediction in rows:
+            if at_home:
                 home_initials = convert_team_name_or_initials(team)
-                away_initials = convert_team_name_or_initials(row["team"])
+                away_initials = convert_team_name_or_initials(opposition)
             else:
-                home_initials = convert_team_name_or_initials(row["team"])
+                home_initials = convert_team_name_or_initials(opposition)
                 away_initials = convert_team_name_or_initials(team)
 
-            # home_goals, away_goals = extract_int_score(row["prediction"])
+            # home_goals, away_goals = extract_int_score(prediction)
 
             predictions[team] = {
-                "date": row["date"].to_pydatetime(),
+                "date": date.to_pydatetime(),
                 "homeInitials": home_initials,
                 "awayInitials": away_initials,
                 "prediction": {
-                    "homeGoals": row["prediction"].home_goals,
-                    "awayGoals": row["prediction"].away_goals,
+                    "homeGoals": prediction.home_goals,
+                    "awayGoals": prediction.away_goals,
                 },
             }
 
         return predictions
 
-    def _next_matchday(self, team: str, fixtures: Fixtures):
-        """Scan through list of fixtures to find the next game that is scheduled."""
-        # Arbitrary initial future date that will always be greater than any possible matchday date
-        future = datetime.now() + timedelta(days=365)
-        matchday = {"date": future, "matchday": None}
+    @staticmethod
+    def _next_matchdays(fixtures: Fixtures):
+        """Find every team's next scheduled game, the earliest dated after now,
+        from the fixtures' status and date blocks at once."""
         now = datetime.now()
-        for matchday_no in fixtures.df.columns.unique(level=0):
-            date = fixtures.df.at[team, (matchday_no, "date")]
-            scheduled = fixtures.df.at[team, (matchday_no, "status")] == "SCHEDULED"
-            if scheduled and now < date < matchday["date"]:
-                matchday["date"] = date
-                matchday["matchday"] = matchday_no
-        return matchday["matchday"]
-
-    def _get_next_game(self, team: str, fixtures: Fixtures):
+        # Arbitrary future date that will always be greater than any possible
+        # matchday date
+        future = now + timedelta(days=365)
+        matchday_nos = fixtures.df.columns.unique(level=0).tolist()
+        status = fixtures.df.xs("status", axis=1, level=1).to_numpy()
+        dates = fixtures.df.xs("date", axis=1, level=1).to_numpy(dtype="datetime64[ns]")
+        upcoming = (
+            (status == "SCHEDULED")
+            & (dates > np.datetime64(now))
+            & (dates < np.datetime64(future))
+        )
+        # Earliest upcoming date in each row, taking the first matchday on a tie
+        first = np.where(upcoming, dates, np.datetime64(future)).argmin(axis=1)
+        next_matchdays: dict[str, Optional[int]] = {}
+        for team, row, j in zip(fixtures.df.index, upcoming, first.tolist()):
+            next_matchdays[team] = matchday_nos[j] if row.any() else None
+        return next_matchdays
+
+    @staticmethod
+    def _get_next_game(team: str, fixtures: Fixtures, next_matchday: Optional[int]):
         date: Optional[str] = None
         opposition: Optional[str] = None
         at_home: Optional[str] = None
 
-        next_matchday = self._next_matchday(team, fixtures)
         if next_matchday is not None:
             date = fixtures.df.at[team, (next_matchday, "date")]
             opposition = fixtures.df.at[team, (next_matchday, "team")]
@@ -132,16 +175,12 @@ class Upcoming(DF):
 
     @staticmethod
     def _ord(n: int):
-        return str(n) + (
-            "th"
-            if 4 <= n % 100 <= 20
-            else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-        )
+        return f"{n}{_DAY_SUFFIXES[n]}"
 
     def _readable_date(self, date: datetime):
-        dt = datetime.strptime(date[:10], "%Y-%m-%d")
-        day = self._ord(dt.day)
-        return day + dt.date().strftime(" %B %Y")
+        # Slice the fields out of the YYYY-MM-DD prefix rather than strptime
+        year, month, day = date[:4], int(date[5:7]), int(date[8:10])
+        return f"{self._ord(day)} {_MONTHS[month]} {year}"
 
     @staticmethod
     def _sort_prev_matches_by_date(next_games: dict):
@@ -152,13 +191,10 @@ class Upcoming(DF):
 
     @staticmethod
     def _team_result(home_goals: int, away_goals: int, at_home: bool):
-        if home_goals == away_goals:
-            return "drew"
-        elif (home_goals > away_goals and at_home) or (
-            away_goals > home_goals and not at_home
-        ):
-            return "won"
-        return "lost"
+        # Index the results by the sign of the goal difference, taken from the
+        # team's side
+        gd = home_goals - away_goals if at_home else away_goals - home_goals
+        return _RESULTS[(gd > 0) - (gd < 0) + 1]
 
     @staticmethod
     def _init_prev_matches(team_names: list[str]):
@@ -176,6 +212,8 @@ class Upcoming(DF):
         season_fixtures = json_data["fixtures"][season]
 
         prev_matches: dict[str, datetime | Scoreline] = self._init_prev_matches(teams)
+        # Hash lookups for the current teams checked against every match
+        current_teams = set(teams)
         for match in season_fixtures:
             if match["status"] != "FINISHED":
                 continue
@@ -183,7 +221,7 @@ class Upcoming(DF):
             home_team = clean_full_team_name(match["homeTeam"]["name"])
             away_team = clean_full_team_name(match["awayTeam"]["name"])
 
-            if home_team not in teams or away_team not in teams:
+            if home_team not in current_teams or away_team not in current_teams:
                 continue
 
             home_goals = match["score"]["fullTime"]["homeTeam"]
@@ -229,15 +267,15 @@ class Upcoming(DF):
     def _calc_next_game_predictions(self, predictor: Predictor, upcoming: DataFrame):
         next_game_predictions: list[dict[str, int]] = []
         next_game_predictions_cache: dict[tuple[str, str], Scoreline] = {}
-        for team, row in upcoming.iterrows():
-            opponent = row["team"]
-
+        for team, opponent, at_home in zip(
+            upcoming.index, upcoming["team"], upcoming["atHome"]
+        ):
             if opponent is None:
                 next_game_predictions.append(None)
                 continue
 
-            home_team = team if row["atHome"] else opponent
-            away_team = opponent if row["atHome"] else team
+            home_team = team if at_home else opponent
+            away_team = opponent if at_home else team
             if (home_team, away_team) in next_game_predictions_cache:
                 prediction = next_game_predictions_cache[(home_team, away_team)]
             else:
@@ -248,9 +286,11 @@ class Upcoming(DF):
 
     def _init_teams(self, fixtures: Fixtures):
         d: dict[str, dict[str, Optional[str] | list]] = {}
-        teams = fixtures.df.index.to_list()
-        for team in teams:
-            date, opposition, at_home = self._get_next_game(team, fixtures)
+        next_matchdays = self._next_matchdays(fixtures)
+        for team, next_matchday in next_matchdays.items():
+            date, opposition, at_home = self._get_next_game(
+                team, fixtures, next_matchday
+            )
             d[team] = {
                 "date": date,
                 "team": opposition,
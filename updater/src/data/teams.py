@@ -1,6 +1,7 @@
-import math
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from data.dataframes import (
     Fixtures,
@@ -44,48 +45,104 @@ class TeamsData:
                 self.upcoming.df,
             ),
             axis=1,
+            # Columns are only joined side by side, so reuse each frame's blocks
+            copy=False,
         )
 
-    def _collapse_tuple_keys(self, d: dict | Any):
-        if isinstance(d, float) and math.isnan(d):
-            # Remove NaN values
-            return None
-        elif isinstance(d, Scoreline):
-            # Unpack Scoreline object into a dict and continue recursing
-            d = d.to_dict()
-        elif isinstance(d, list):
-            for i, v in enumerate(d):
-                d[i] = self._collapse_tuple_keys(v)
-            return d
-        elif not isinstance(d, dict):
-            # If hit bottom of tree, stop recursing
-            return d
+    @staticmethod
+    @lru_cache(maxsize=None, typed=True)
+    def _collapse_key(k: Any):
+        # The same few hundred column and index keys repeat for every row, so
+        # each is only normalised once
+        if isinstance(k, tuple):
+            # Remove blank multi-index levels
+            k = tuple(x for x in k if x != "")
+            if len(k) != 1:
+                return tuple(str(x) for x in k)
+            k = k[0]  # If only one level remains, take the single heading
+        if isinstance(k, int):
+            return str(k)
+        return k
 
-        new_d = {}
-        for k, v in d.items():
-            if isinstance(k, tuple):
-                # Remove blank multi-index levels
-                k = [x for x in k if x != ""]
-                if len(k) == 1:
-                    k = k[0]  # If only one level remains, take the single heading
+    def _collapse_tuple_keys(self, d: dict | Any):
+        # Walk the tree with an explicit stack of (container, key, value) items,
+        # each collapsed value being written into container[key]
+        root = {}
+        stack = [(root, None, d)]
+        while stack:
+            parent, key, v = stack.pop()
+            # Branch on the exact type once rather than a chain of isinstance
+            # checks, as the tree only holds plain dicts, lists and Scorelines
+            kind = type(v)
+            if kind is Scoreline:
+                # Unpack Scoreline object into a dict and continue collapsing
+                v = v.to_dict()
+            elif kind is list:
+                parent[key] = v
+                stack.extend((v, i, x) for i, x in enumerate(v))
+                continue
+            elif kind is not dict:
+                # Hit bottom of tree
+                parent[key] = v
+                continue
 
-            if isinstance(k, list):
-                # Separate multi-index into a nested dict
-                temp_d = new_d
-                for i, _k in enumerate(k):
-                    _k = str(_k)
-                    if _k not in temp_d:
-                        temp_d[_k] = {}
-                    if i == len(k) - 1:
-                        temp_d[_k] = self._collapse_tuple_keys(v)
-                    else:
+            new_d = {}
+            parent[key] = new_d
+            for k, x in v.items():
+                k = self._collapse_key(k)
+                if isinstance(k, tuple):
+                    # Separate multi-index into a nested dict
+                    if len(k) == 0:
+                        continue
+                    temp_d = new_d
+                    for _k in k[:-1]:
+                        if _k not in temp_d:
+                            temp_d[_k] = {}
                         temp_d = temp_d[_k]
-            elif isinstance(k, int):
-                new_d[str(k)] = self._collapse_tuple_keys(v)
-            else:
-                new_d[k] = self._collapse_tuple_keys(v)
+                    parent_d, k = temp_d, k[-1]
+                else:
+                    parent_d = new_d
+                # Hold the key's position until its value has been collapsed
+                parent_d[k] = None
+                stack.append((parent_d, k, x))
+
+        return root[None]
+
+    def _df_collapsed_dict(self, df: pd.DataFrame):
+        """Equivalent of collapsing the tuple keys of df.to_dict(orient="index")
+        with NaN values as None, writing each row straight into its nested dict
+        rather than building the tuple-keyed dict and walking it afterwards."""
+        # Path of nested keys each column collapses to, worked out once
+        paths: list[tuple | None] = []
+        for column in df.columns.tolist():
+            k = self._collapse_key(column)
+            if not isinstance(k, tuple):
+                k = (k,)
+            # Columns with only blank levels are dropped
+            paths.append(k if len(k) != 0 else None)
 
-        return new_d
+        values = [column.tolist() for _, column in df.items()]
+        # Replace NaN with None, locating them with one vectorised isna call
+        for i, j in zip(*np.nonzero(df.isna().to_numpy())):
+            values[j][i] = None
+
+        d = {}
+        for index, row in zip(df.index.tolist(), zip(*values)):
+            row_d = {}
+            for path, v in zip(paths, row):
+                if path is None:
+                    continue
+                parent_d = row_d
+                for k in path[:-1]:
+                    if k not in parent_d:
+                        parent_d[k] = {}
+                    parent_d = parent_d[k]
+                if type(v) in (dict, list, Scoreline):
+                    # Only cell values holding containers need walking
+                    v = self._collapse_tuple_keys(v)
+                parent_d[path[-1]] = v
+            d[self._collapse_key(index)] = row_d
+        return d
 
     def to_dict(self):
         if not self.all_built():
@@ -93,17 +150,15 @@ class TeamsData:
                 "Cannot convert TeamsData instance to dictionary: A DataFrame is empty."
             )
 
-        # Build one dict containing all DataFrames
+        # Build one dict containing all DataFrames, with tuple keys collapsed
+        # and int keys converted to str as each one is written
         d = {
             "lastUpdated": self.last_updated,
-            "fixtures": self.fixtures.df.to_dict(orient="index"),
-            "standings": self.standings.df.to_dict(orient="index"),
-            "teamRatings": self.team_ratings.df.to_dict(orient="index"),
-            "homeAdvantages": self.home_advantages.df.to_dict(orient="index"),
-            "form": self.form.df.to_dict(orient="index"),
-            "upcoming": self.upcoming.df.to_dict(orient="index"),
+            "fixtures": self._df_collapsed_dict(self.fixtures.df),
+            "standings": self._df_collapsed_dict(self.standings.df),
+            "teamRatings": self._df_collapsed_dict(self.team_ratings.df),
+            "homeAdvantages": self._df_collapsed_dict(self.home_advantages.df),
+            "form": self._df_collapsed_dict(self.form.df),
+            "upcoming": self._df_collapsed_dict(self.upcoming.df),
         }
-
-        # Collapse tuple keys, convert int key to str and remove NaN values
-        d = self._collapse_tuple_keys(d)
         return d
@@ -1,62 +1,39 @@
-from typing import Hashable
-
-
-class TwoWayDict(dict):
-    def __init__(self, dict: dict[Hashable, Hashable]):
-        super().__init__()
-        for key, value in dict.items():
-            self.__setitem__(key, value)
-
-    def __setitem__(self, key: Hashable, value: Hashable):
-        # Remove any previous connections with these values
-        if key in self:
-            del self[key]
-        if value in self:
-            del self[value]
-        dict.__setitem__(self, key, value)
-        dict.__setitem__(self, value, key)
-
-    def __delitem__(self, key: Hashable):
-        dict.__delitem__(self, self[key])
-        dict.__delitem__(self, key)
-
-    def __len__(self):
-        """Returns the number of connections"""
-        return dict.__len__(self) // 2
-
-
-names_and_initials = TwoWayDict(
-    {
-        "ARS": "Arsenal",
-        "AVL": "Aston Villa",
-        "BHA": "Brighton and Hove Albion",
-        "BUR": "Burnley",
-        "BRE": "Brentford",
-        "BOU": "Bournemouth",
-        "CHE": "Chelsea",
-        "CRY": "Crystal Palace",
-        "EVE": "Everton",
-        "FUL": "Fulham",
-        "LEE": "Leeds United",
-        "LEI": "Leicester City",
-        "LIV": "Liverpool",
-        "LUT": "Luton Town",
-        "MCI": "Manchester City",
-        "MUN": "Manchester United",
-        "NOR": "Norwich City",
-        "NEW": "Newcastle United",
-        "SHU": "Sheffield United",
-        "SOU": "Southampton",
-        "TOT": "Tottenham Hotspur",
-        "WAT": "Watford",
-        "WBA": "West Bromwich Albion",
-        "WHU": "West Ham United",
-        "WOL": "Wolverhampton Wanderers",
-        "NOT": "Nottingham Forest",
-    }
-)
-
-
+import re
+from functools import lru_cache
+
+initials_to_name = {
+    "ARS": "Arsenal",
+    "AVL": "Aston Villa",
+    "BHA": "Brighton and Hove Albion",
+    "BUR": "Burnley",
+    "BRE": "Brentford",
+    "BOU": "Bournemouth",
+    "CHE": "Chelsea",
+    "CRY": "Crystal Palace",
+    "EVE": "Everton",
+    "FUL": "Fulham",
+    "LEE": "Leeds United",
+    "LEI": "Leicester City",
+    "LIV": "Liverpool",
+    "LUT": "Luton Town",
+    "MCI": "Manchester City",
+    "MUN": "Manchester United",
+    "NOR": "Norwich City",
+    "NEW": "Newcastle United",
+    "SHU": "Sheffield United",
+    "SOU": "Southampton",
+    "TOT": "Tottenham Hotspur",
+    "WAT": "Watford",
+    "WBA": "West Bromwich Albion",
+    "WHU": "West Ham United",
+    "WOL": "Wolverhampton Wanderers",
+    "NOT": "Nottingham Forest",
+}
+# Reverse lookup, so each direction is a single plain dict lookup
+name_to_initials = {name: initials for initials, name in initials_to_name.items()}
+
+
+@lru_cache(maxsize=128)
 def convert_team_name_or_initials(team: str):
     """Converts team name to three-letter initials, or converts three-letter
     initials to a team name.
@@ -70,9 +47,13 @@ def convert_team_name_or_initials(team: str):
     Returns:
         str: Three-letter team initials or team name.
     """
-    if team in names_and_initials:
-        return names_and_initials[team]
-    elif len(team) == 3:
+    initials = name_to_initials.get(team)
+    if initials is not None:
+        return initials
+    name = initials_to_name.get(team)
+    if name is not None:
+        return name
+    if len(team) == 3:
         # Cannot convert initials to a full team name if not in dict
         raise KeyError(
             f"Team name {team} corresponding to input initials does not exist"
@@ -82,28 +63,29 @@ def convert_team_name_or_initials(team: str):
     return team[:3].upper()
 
 
+@lru_cache(maxsize=1024)
 def extract_int_score(score: str):
-    home, _, away = score.split(" ")
+    home, _, away = score.split(" ", 2)
     return int(home), int(away)
 
 
 def extract_str_score(score: str):
-    home, _, away = score.split(" ")
+    home, _, away = score.split(" ", 2)
     return home, away
 
 
 def extract_int_score_from_scoreline(score: str):
-    _, home, _, away, _ = score.split(" ")
+    _, home, _, away, _ = score.split(" ", 4)
     return int(home), int(away)
 
 
 def extract_str_score_from_scoreline(score: str):
-    _, home, _, away, _ = score.split(" ")
+    _, home, _, away, _ = score.split(" ", 4)
     return home, away
 
 
 def extract_scoreline(score: str):
-    home_initials, home_goals, _, away_goals, away_initials = score.split(" ")
+    home_initials, home_goals, _, away_goals, away_initials = score.split(" ", 4)
     return home_initials, int(home_goals), int(away_goals), away_initials
 
 
@@ -111,18 +93,19 @@ def identical_fixtures(scoreline1: str, scoreline2: str):
     if scoreline1 is None or scoreline2 is None:
         return False
 
-    home_p, _, _, _, away_p = scoreline1.split(" ")
-    home_s, _, _, _, away_s = scoreline2.split(" ")
+    home_p, _, _, _, away_p = scoreline1.split(" ", 4)
+    home_s, _, _, _, away_s = scoreline2.split(" ", 4)
     identical = (home_p == home_s) and (away_p == away_s)
     return identical
 
 
 def identical_result(predicted_home_goals, predicted_away_goals, act_home_goals, act_away_goals):
-    return (
-        (predicted_home_goals == predicted_away_goals and act_home_goals == act_away_goals)
-        or (predicted_home_goals > predicted_away_goals and act_home_goals > act_away_goals)
-        or (predicted_home_goals < predicted_away_goals and act_home_goals < act_away_goals)
+    # Same result when the signs of the two goal differences match
+    predicted = (predicted_home_goals > predicted_away_goals) - (
+        predicted_home_goals < predicted_away_goals
     )
+    actual = (act_home_goals > act_away_goals) - (act_home_goals < act_away_goals)
+    return predicted == actual
 
 
 def format_scoreline_str_from_str(
@@ -156,6 +139,12 @@ def format_scoreline_str(
     return scoreline
 
 
+# Postfixes and symbols cleaned from API team names, replaced in one pass
+_CLEAN_NAME_REPL = {" FC": "", "AFC ": "", "&": "and"}
+_CLEAN_NAME_RE = re.compile("|".join(map(re.escape, _CLEAN_NAME_REPL)))
+
+
+@lru_cache(maxsize=128)
 def clean_full_team_name(full_team_name: str):
     """Remove FC, AFC postfixes and replace ampersand for 'and'."""
-    return full_team_name.replace(" FC", "").replace("AFC ", "").replace("&", "and")
+    return _CLEAN_NAME_RE.sub(lambda m: _CLEAN_NAME_REPL[m.group(0)], full_team_name)
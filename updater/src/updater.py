@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from datetime import datetime
 from os import getenv
@@ -7,6 +6,7 @@ from os.path import dirname, join
 from typing import Optional
 
 import aiohttp
+import orjson
 from data import Data
 from database import Database
 from dotenv import load_dotenv
@@ -68,7 +68,7 @@ class Updater:
             else:
                 logging.debug(f"✅ Status: {response.status} [{url}]")
 
-            data: dict = await response.json()
+            data: dict = await response.json(loads=orjson.loads)
             logging.debug(f"Received data from {url}")
             return data
 
@@ -81,8 +81,8 @@ class Updater:
 
     def load_fixtures_data(self, season: int):
         logging.debug(f"💾 Loading fixtures data for season {season}...")
-        with open(f"backups/fixtures/fixtures_{season}.json", "r") as json_file:
-            return json.load(json_file)
+        with open(f"backups/fixtures/fixtures_{season}.json", "rb") as json_file:
+            return orjson.loads(json_file.read())
 
     async def fetch_standings_data(self, season: int):
         data: dict = await self.get(
@@ -93,8 +93,8 @@ class Updater:
 
     def load_standings_data(self, season: int):
         logging.debug(f"💾 Loading standings data for season {season}...")
-        with open(f"backups/standings/standings_{season}.json", "r") as json_file:
-            return json.load(json_file)
+        with open(f"backups/standings/standings_{season}.json", "rb") as json_file:
+            return orjson.loads(json_file.read())
 
     async def fetch_fantasy_general_data(self):
         data: dict = await self.get(
@@ -104,8 +104,8 @@ class Updater:
 
     def load_fantasy_general_data(self, season: int):
         logging.debug(f"💾 Loading fantasy data for season {season}...")
-        with open(f"backups/fantasy/general_{season}.json", "r") as json_file:
-            return json.load(json_file)
+        with open(f"backups/fantasy/general_{season}.json", "rb") as json_file:
+            return orjson.loads(json_file.read())
 
     async def fetch_fantasy_fixtures_data(self):
         data: dict = await self.get("https://fantasy.premierleague.com/api/fixtures/")
@@ -113,8 +113,8 @@ class Updater:
 
     def load_fantasy_fixtures_data(self, season: int):
         logging.debug(f"💾 Loading fantasy fixtures data for season {season}...")
-        with open(f"backups/fantasy/fixtures_{season}.json", "r") as json_file:
-            return json.load(json_file)
+        with open(f"backups/fantasy/fixtures_{season}.json", "rb") as json_file:
+            return orjson.loads(json_file.read())
 
     async def fetch_current_season(self):
         """Fetch teams data and fantasy data from football data API and stores
@@ -181,12 +181,12 @@ class Updater:
         local store.
         """
         for type in ("fixtures", "standings"):
-            with open(f"backups/{type}/{type}_{self.current_season}.json", "w") as f:
-                json.dump(self.raw_data[type][self.current_season], f)
+            with open(f"backups/{type}/{type}_{self.current_season}.json", "wb") as f:
+                f.write(orjson.dumps(self.raw_data[type][self.current_season]))
 
         for type in ("general", "fixtures"):
-            with open(f"backups/fantasy/{type}_{self.current_season}.json", "w") as f:
-                json.dump(self.raw_data["fantasy"][type], f)
+            with open(f"backups/fantasy/{type}_{self.current_season}.json", "wb") as f:
+                f.write(orjson.dumps(self.raw_data["fantasy"][type]))
 
     def build_dataframes(self, num_seasons: int, display_tables: bool = False):
         """Builds all DataFrames within `self.data` using the raw data.
@@ -300,9 +300,14 @@ class Updater:
             logging.info("💾 Saving new team data to local backup...")
             self.save_local_backup()
             if update_db:
-                logging.info("💾 Saving new team data to database...")
-                self.save_team_data_to_db()
-                logging.info("💾 Saving new fantasy data to database...")
-                self.save_fantasy_data_to_db()
-                logging.info("💾 Saving predictions to database...")
-                self.save_predictions_to_db()
+                try:
+                    logging.info("💾 Saving new fantasy data to database...")
+                    self.save_fantasy_data_to_db()
+                    logging.info("💾 Saving predictions to database...")
+                    self.save_predictions_to_db()
+                    # Team data holds the lastUpdated timestamp the dashboard
+                    # caches are keyed on, so write it once everything else is
+                    logging.info("💾 Saving new team data to database...")
+                    self.save_team_data_to_db()
+                finally:
+                    self.database.close()